@@ -1,5 +1,6 @@
 """Command Line Interface for Dirac-Wallet (chain-agnostic, ML-DSA quantum identity)."""
 import asyncio
+import os
 from datetime import datetime, timezone
 from decimal import Decimal
 from pathlib import Path
@@ -12,7 +13,6 @@ from rich.table import Table
 
 from ..account import create_account
 from ..chains import get_adapter
-from ..network.solana_client import QuantumSolanaClient
 from ..vault import LegacyWalletError, Vault
 
 console = Console()
@@ -158,6 +158,9 @@ def balance(path, network, name):
         return
     _vault, account, _history, _pw = opened
 
+    # Deferred: solana/aiohttp load only for commands that hit the network
+    from ..network.solana_client import QuantumSolanaClient
+
     async def run():
         client = QuantumSolanaClient(network=network)
         try:
@@ -188,14 +191,19 @@ def send(path, network, name, recipient, amount):
     lamports = int(Decimal(str(amount)) * Decimal(10 ** 9))
     adapter = get_adapter("solana")
 
+    from ..network.solana_client import QuantumSolanaClient
+
     async def run():
         client = QuantumSolanaClient(network=network)
         try:
             await client.connect()
-            bal = await client.get_balance(account.address)
+            # Independent reads: fetch the balance and blockhash concurrently
+            bal, blockhash = await asyncio.gather(
+                client.get_balance(account.address),
+                client.get_recent_blockhash(),
+            )
             if bal < amount:
                 return {"error": f"Insufficient balance: {bal} SOL (need {amount})"}
-            blockhash = await client.get_recent_blockhash()
             tx = adapter.build_signed_transfer(account, recipient, lamports, str(blockhash))
             print_info("Transaction signed with ed25519 (Solana on-chain key)...")
             result = await client.submit_quantum_transaction(tx)
@@ -250,12 +258,14 @@ def airdrop(path, network, name, amount):
         return
     _vault, account, _history, _pw = opened
 
+    from ..network.solana_client import QuantumSolanaClient
+
     async def run():
         client = QuantumSolanaClient(network=network)
         try:
             await client.connect()
             print_info(f"Requesting {amount} SOL airdrop via RPC...")
-            tx_id = await client.request_airdrop(account.address, amount)
+            tx_id = await client.request_airdrop_sol(account.address, amount)
             if not tx_id:
                 return {"error": "Airdrop failed (rate limited or unavailable). "
                                  "Try https://faucet.solana.com"}
@@ -291,6 +301,8 @@ def history(path, network, limit, refresh, name):
     if refresh:
         print_info("Refreshing from network...")
 
+        from ..network.solana_client import QuantumSolanaClient
+
         async def run():
             client = QuantumSolanaClient(network=network)
             try:
@@ -319,20 +331,29 @@ def history(path, network, limit, refresh, name):
 @cli.command(name="list-wallets")
 def list_wallets():
     """List all wallets in the default directory."""
-    if not WALLET_DIR.exists() or not list(WALLET_DIR.glob("*.dwf")):
+    # One directory scan; DirEntry.is_file() answers from the cached dirent type
+    try:
+        with os.scandir(WALLET_DIR) as entries:
+            wallets = sorted(
+                (entry.name, entry.path) for entry in entries
+                if entry.name.endswith(".dwf") and entry.is_file()
+            )
+    except FileNotFoundError:
+        wallets = []
+    if not wallets:
         print_info("No wallets found")
         return
     table = Table(title="Available Wallets", box=box.ROUNDED)
     table.add_column("Name", style="cyan")
     table.add_column("Network", style="magenta")
     table.add_column("Path", style="white")
-    for f in sorted(WALLET_DIR.glob("*.dwf")):
-        stem = f.stem
+    for filename, path in wallets:
+        stem = filename[:-len(".dwf")]
         if stem.endswith(("_devnet", "_testnet", "_mainnet")):
             name, net = stem.rsplit("_", 1)
         else:
             name, net = stem, "unknown"
-        table.add_row(name, net, str(f))
+        table.add_row(name, net, path)
     console.print(table)
 
 
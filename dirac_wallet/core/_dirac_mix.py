@@ -0,0 +1,38 @@
+"""
+DiracHash "improved" digest, JIT-compiled when numba is available
+
+The numba kernel (_dirac_kernel) is imported and compiled on the first hash
+rather than at import time, so modules that never hash don't pay for loading
+numba. Without numba every call goes to the pure Python DiracHash.
+"""
+import importlib.util
+import threading
+
+from quantum_hash import DiracHash
+
+# find_spec only locates the package; numba itself is imported on first use
+HAVE_NUMBA = importlib.util.find_spec("numba") is not None
+
+_kernel_hash = None
+_kernel_lock = threading.Lock()
+
+
+def _load_kernel():
+    """Import the JIT kernel once, falling back to DiracHash if that fails"""
+    global _kernel_hash
+    with _kernel_lock:
+        if _kernel_hash is None:
+            try:
+                from ._dirac_kernel import improved_hash as kernel_hash
+            except ImportError:
+                kernel_hash = DiracHash.improved_hash
+            _kernel_hash = kernel_hash
+    return _kernel_hash
+
+
+def improved_hash(data, digest_size: int = 32) -> bytes:
+    """DiracHash "improved" digest, computed by the JIT kernel when available"""
+    kernel_hash = _kernel_hash
+    if kernel_hash is None:
+        kernel_hash = _load_kernel() if HAVE_NUMBA else DiracHash.improved_hash
+    return kernel_hash(data, digest_size)
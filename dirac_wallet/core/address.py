@@ -2,14 +2,33 @@
 Address derivation for Dirac-Wallet using quantum-resistant keys
 """
 import hashlib
+import hmac
 import base58
+from functools import partial
 from typing import Dict
 from solders.keypair import Keypair
 
-from quantum_hash import DiracHash
-from .keys import KeyPair
+from ._dirac_mix import improved_hash as _improved_hash
+from .keys import KeyPair, QuantumKeyManager
 from ..utils.logger import logger
 
+# 32-byte DiracHash "improved", bound once so calls skip algorithm dispatch
+_DHASH = partial(_improved_hash, digest_size=32)
+
+
+# One key manager per security level, shared by the address helpers
+_KEY_MANAGERS: Dict[int, QuantumKeyManager] = {}
+
+
+def _get_km(security_level: int) -> QuantumKeyManager:
+    """Return the shared QuantumKeyManager for a security level"""
+    key_manager = _KEY_MANAGERS.get(security_level)
+    if key_manager is None:
+        key_manager = _KEY_MANAGERS.setdefault(
+            security_level, QuantumKeyManager(security_level=security_level)
+        )
+    return key_manager
+
 
 class AddressDerivation:
     """Handles address generation from quantum-resistant keys"""
@@ -24,7 +43,7 @@ class AddressDerivation:
         try:
             # Use DiracHash to create a 32-byte hash from the quantum public key
             # This gives us a standard 32-byte key that Solana expects
-            key_hash = DiracHash.hash(public_key_bytes, digest_size=32, algorithm="improved")
+            key_hash = _DHASH(public_key_bytes)
             
             # Convert to Solana address format using base58 encoding
             address = base58.b58encode(key_hash).decode('ascii')
@@ -36,6 +55,15 @@ class AddressDerivation:
             logger.error(f"Failed to derive Solana address: {str(e)}")
             raise
     
+    @staticmethod
+    def _public_key_bytes(keypair: KeyPair) -> bytes:
+        """Serialized public key, computed once and cached on the keypair"""
+        pub_key_bytes = getattr(keypair, '_pub_bytes', None)
+        if pub_key_bytes is None:
+            pub_key_bytes = _get_km(keypair.security_level).get_public_key_bytes(keypair.public_key)
+            keypair._pub_bytes = pub_key_bytes
+        return pub_key_bytes
+    
     @staticmethod
     def create_quantum_keypair(keypair: KeyPair) -> Dict:
         """
@@ -48,9 +76,7 @@ class AddressDerivation:
         """
         try:
             # Extract public key bytes (using improved method from QuantumKeyManager)
-            from .keys import QuantumKeyManager
-            key_manager = QuantumKeyManager(security_level=keypair.security_level)
-            pub_key_bytes = key_manager.get_public_key_bytes(keypair.public_key)
+            pub_key_bytes = AddressDerivation._public_key_bytes(keypair)
             
             # Create a deterministic seed from the quantum public key
             hasher = hashlib.sha256()
@@ -60,6 +86,7 @@ class AddressDerivation:
             # Create a Solana keypair from the seed
             solana_keypair = Keypair.from_seed(seed)
             solana_address = str(solana_keypair.pubkey())
+            keypair._solana_address = solana_address
             
             # Create hybrid keypair info
             hybrid_keypair = {
@@ -87,11 +114,20 @@ class AddressDerivation:
         Verify that a Solana address correctly maps to a quantum keypair
         """
         try:
+            # Keypairs that already went through create_quantum_keypair carry their
+            # derived address, so a constant-time compare is enough
+            cached_address = getattr(quantum_keypair, '_solana_address', None)
+            if cached_address is not None:
+                is_valid = hmac.compare_digest(
+                    cached_address.encode('utf-8'),
+                    solana_address.encode('utf-8')
+                )
+                logger.debug(f"Address mapping verification (cached): {is_valid}")
+                return is_valid
+            
             # Re-derive the address from the quantum keypair using the same 
             # method as in create_quantum_keypair
-            from .keys import QuantumKeyManager
-            key_manager = QuantumKeyManager(security_level=quantum_keypair.security_level)
-            pub_key_bytes = key_manager.get_public_key_bytes(quantum_keypair.public_key)
+            pub_key_bytes = AddressDerivation._public_key_bytes(quantum_keypair)
             
             # Create a deterministic seed from the quantum public key
             hasher = hashlib.sha256()
@@ -101,8 +137,12 @@ class AddressDerivation:
             # Create a Solana keypair from the seed
             solana_keypair = Keypair.from_seed(seed)
             derived_address = str(solana_keypair.pubkey())
+            quantum_keypair._solana_address = derived_address
             
-            is_valid = derived_address == solana_address
+            is_valid = hmac.compare_digest(
+                derived_address.encode('utf-8'),
+                solana_address.encode('utf-8')
+            )
             logger.debug(f"Address mapping verification: {is_valid}")
             return is_valid
             
@@ -3,7 +3,7 @@ Quantum-resistant key generation using Dilithium
 """
 import base64
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Tuple, Dict, Optional
 
 from quantum_hash.signatures import DilithiumSignature
@@ -19,13 +19,20 @@ class KeyPair:
     algorithm: str = "dilithium"
     security_level: int = 3
     _secure_storage: Optional[SecureStorage] = None
+    # Serialized public key and derived Solana address, filled in lazily by AddressDerivation
+    _pub_bytes: Optional[bytes] = field(default=None, repr=False, compare=False)
+    _solana_address: Optional[str] = field(default=None, repr=False, compare=False)
                 
-    def serialize(self) -> Dict:
-        """Serialize keypair to dict for storage"""
+    def serialize(self, binary: bool = False) -> Dict:
+        """Serialize keypair to dict for storage
+        
+        With binary=True key bytes are kept raw (for binary formats such as CBOR)
+        instead of being base64-encoded.
+        """
         serialized = {
             "algorithm": self.algorithm,
             "security_level": self.security_level,
-            "public_key": self._serialize_key(self.public_key)
+            "public_key": self._serialize_key(self.public_key, binary)
         }
         
         # Only store encrypted private key if secure storage is available
@@ -34,7 +41,7 @@ class KeyPair:
             serialized["encrypted_private_key"] = base64.b64encode(encrypted_private).decode()
             serialized["salt"] = base64.b64encode(self._secure_storage.get_salt()).decode()
         else:
-            serialized["private_key"] = self._serialize_key(self.private_key)
+            serialized["private_key"] = self._serialize_key(self.private_key, binary)
             
         return serialized
     
@@ -63,8 +70,12 @@ class KeyPair:
         logger.info("Secure storage initialized for keypair")
     
     @staticmethod
-    def _serialize_key(key: Dict) -> Dict:
+    def _serialize_key(key: Dict, binary: bool = False) -> Dict:
         """Helper to serialize individual key components"""
+        if binary:
+            # Binary formats carry bytes natively; _deserialize_key passes them through
+            return dict(key)
+        
         serialized = {}
         for k, v in key.items():
             if isinstance(v, bytes):
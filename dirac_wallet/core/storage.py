@@ -2,7 +2,7 @@
 Secure storage for wallet data
 """
 import os
-from typing import Union
+from typing import Dict, Union
 from Crypto.Cipher import AES
 from Crypto.Random import get_random_bytes
 from Crypto.Protocol.KDF import PBKDF2
@@ -10,6 +10,47 @@ from Crypto.Hash import SHA256
 from ..utils.logger import logger
 
 
+# Wallet paths with this prefix live in process memory instead of on disk
+MEMORY_SCHEME = "mem://"
+
+# Contents of every in-memory wallet file, keyed by its mem:// URI
+_memory_files: Dict[str, bytes] = {}
+
+
+class MemoryPath:
+    """Path-like wallet location backed by a process-wide dict
+    
+    Supports the subset of pathlib.Path that DiracWallet uses for its wallet file,
+    so tests can create and unlock wallets without touching the filesystem.
+    """
+    
+    def __init__(self, uri: str):
+        self.uri = uri
+    
+    def exists(self) -> bool:
+        return self.uri in _memory_files
+    
+    def read_bytes(self) -> bytes:
+        try:
+            return _memory_files[self.uri]
+        except KeyError:
+            raise FileNotFoundError(f"No in-memory wallet at {self.uri}") from None
+    
+    def write_bytes(self, data: bytes) -> int:
+        _memory_files[self.uri] = bytes(data)
+        return len(data)
+    
+    def unlink(self, missing_ok: bool = False):
+        if _memory_files.pop(self.uri, None) is None and not missing_ok:
+            raise FileNotFoundError(f"No in-memory wallet at {self.uri}")
+    
+    def __str__(self) -> str:
+        return self.uri
+    
+    def __repr__(self) -> str:
+        return f"MemoryPath({self.uri!r})"
+
+
 class SecureStorage:
     """Handles secure encryption and decryption of wallet data"""
     
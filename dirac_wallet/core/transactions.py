@@ -2,6 +2,8 @@
 Transaction handling for Dirac-Wallet with quantum-resistant signatures
 """
 import json
+import struct
+from functools import partial
 from typing import Dict, List, Optional, Union, Tuple
 from dataclasses import dataclass
 from solders.pubkey import Pubkey
@@ -15,8 +17,13 @@ from decimal import Decimal
 from solders.signature import Signature
 
 from .wallet import DiracWallet
+from .keys import QuantumKeyManager
 from ..utils.logger import logger
-from quantum_hash import DiracHash
+from ._dirac_mix import improved_hash as _improved_hash
+
+# DiracHash "improved" runs through the numba kernel when numba is installed,
+# bound once to 32 bytes so calls skip algorithm dispatch
+_DHASH = partial(_improved_hash, digest_size=32)
 
 
 @dataclass
@@ -38,21 +45,56 @@ class QuantumTransaction:
     def __init__(self, wallet: DiracWallet):
         """Initialize with a DiracWallet instance"""
         self.wallet = wallet
-        self.instructions: List[Instruction] = []
-        self.fee_payer = Pubkey.from_string(wallet.solana_address)
+        # Private so every change goes through add_instruction/create_transfer,
+        # which invalidate the caches; exposed read-only via `instructions`
+        self._instructions: List[Instruction] = []
+        self._fee_payer = Pubkey.from_string(wallet.solana_address)
         self.recent_blockhash: Optional[Hash] = None
         
+        # Transfer details recorded by create_transfer; None means scan instructions
+        self._amount: Optional[int] = None
+        self._recipient: Optional[str] = None
+        
+        # Built message (keyed by blockhash) and broadcast output (keyed by blockhash
+        # string), reused until an instruction or the fee payer changes
+        self._message_cache: Optional[Tuple[Hash, Message]] = None
+        self._broadcast_cache: Optional[Tuple[str, Tuple[bytes, Dict]]] = None
+        
         logger.debug("Initialized QuantumTransaction")
     
+    @property
+    def instructions(self) -> Tuple[Instruction, ...]:
+        """Instructions added so far (read-only; use add_instruction to change them)"""
+        return tuple(self._instructions)
+    
+    @property
+    def fee_payer(self) -> Pubkey:
+        """Account paying the transaction fee"""
+        return self._fee_payer
+    
+    @fee_payer.setter
+    def fee_payer(self, fee_payer: Pubkey):
+        self._fee_payer = fee_payer
+        self._invalidate_cache()
+    
+    def _invalidate_cache(self):
+        """Drop the cached message and broadcast output"""
+        self._message_cache = None
+        self._broadcast_cache = None
+    
     def add_instruction(self, instruction: Instruction):
         """Add instruction to transaction"""
-        self.instructions.append(instruction)
+        self._instructions.append(instruction)
+        self._invalidate_cache()
         logger.debug(f"Added instruction to transaction: {instruction.program_id}")
     
-    def create_transfer(self, recipient: str, amount: int):
-        """Create a transfer instruction"""
+    def create_transfer(self, recipient: Union[str, Pubkey], amount: int):
+        """Create a transfer instruction; recipient may be base58 or a parsed Pubkey"""
         # Convert recipient to Pubkey
-        recipient_pubkey = Pubkey.from_string(recipient)
+        if isinstance(recipient, Pubkey):
+            recipient_pubkey = recipient
+        else:
+            recipient_pubkey = Pubkey.from_string(recipient)
         
         # Create transfer instruction using system program
         instruction = transfer(
@@ -63,20 +105,30 @@ class QuantumTransaction:
             )
         )
         
-        self.instructions.append(instruction)
+        # The first system instruction is the one the extractors report
+        if not self._instructions:
+            self._amount = amount
+            self._recipient = str(recipient)
+        
+        self._instructions.append(instruction)
+        self._invalidate_cache()
         
     def build_message(self) -> Message:
         """Build transaction message"""
         if not self.recent_blockhash:
             raise ValueError("Recent blockhash not set")
+        
+        if self._message_cache is not None and self._message_cache[0] == self.recent_blockhash:
+            return self._message_cache[1]
             
         # Create message
         message = Message.new_with_blockhash(
-            self.instructions,
+            self._instructions,
             self.fee_payer,
             self.recent_blockhash
         )
         
+        self._message_cache = (self.recent_blockhash, message)
         return message
     
     def sign_transaction(self, recent_blockhash: Union[str, Hash] = None) -> TransactionInfo:
@@ -94,20 +146,17 @@ class QuantumTransaction:
             if not blockhash:
                 raise ValueError("Recent blockhash required")
             
-            # Build message
+            # Build message; Message.new_with_blockhash embeds the blockhash
+            self.recent_blockhash = blockhash
             message = self.build_message()
             
             # We can't use standard Transaction.sign since we're using quantum signatures
-            # Instead, serialize manually
-            
-            # Convert message to bytes using bytes() function
+            # Instead, sign the canonical serialized message (same bytes as
+            # Transaction.new_unsigned(message).message_data())
             message_bytes = bytes(message)
             
-            # For custom format with blockhash, append the blockhash bytes
-            message_with_blockhash = message_bytes + bytes(blockhash)
-            
             # Hash the message for signing
-            message_to_sign = DiracHash.hash(message_with_blockhash, digest_size=32, algorithm="improved")
+            message_to_sign = _DHASH(message_bytes)
             
             # Sign with quantum-resistant signature
             quantum_signature = self.wallet.key_manager.sign_message(
@@ -118,7 +167,7 @@ class QuantumTransaction:
             # Create transaction info
             transaction_info = TransactionInfo(
                 signature=quantum_signature,
-                raw_transaction=message_with_blockhash,
+                raw_transaction=message_bytes,
                 blockhash=str(blockhash),
                 amount=self._get_transfer_amount(),
                 recipient=self._get_transfer_recipient(),
@@ -134,23 +183,24 @@ class QuantumTransaction:
     
     def _get_transfer_amount(self) -> Optional[int]:
         """Extract transfer amount from instructions"""
-        for instruction in self.instructions:
-            if str(instruction.program_id) == '11111111111111111111111111111111':  # System program
-                try:
-                    # Extract amount from instruction data
-                    # This is a simplified extraction for transfer instructions
-                    if len(instruction.data) >= 12:
-                        # First 4 bytes is instruction type, next 8 bytes is lamports
-                        amount_bytes = instruction.data[4:12]
-                        return int.from_bytes(amount_bytes, byteorder='little')
-                except:
-                    pass
+        if self._amount is not None:
+            return self._amount
+        
+        for instruction in self._instructions:
+            if instruction.program_id == SYSTEM_PROGRAM_ID:
+                data = instruction.data
+                # First 4 bytes is instruction type, next 8 bytes is lamports
+                if len(data) >= 12:
+                    return struct.unpack_from('<Q', data, 4)[0]
         return None
     
     def _get_transfer_recipient(self) -> Optional[str]:
         """Extract recipient from instructions"""
-        for instruction in self.instructions:
-            if str(instruction.program_id) == '11111111111111111111111111111111':  # System program
+        if self._recipient is not None:
+            return self._recipient
+        
+        for instruction in self._instructions:
+            if instruction.program_id == SYSTEM_PROGRAM_ID:
                 if len(instruction.accounts) >= 2:
                     # Second account in transfer is recipient
                     return str(instruction.accounts[1].pubkey)
@@ -165,6 +215,11 @@ class QuantumTransaction:
         """Prepare transaction for broadcast"""
         if not self.wallet.is_unlocked:
             raise ValueError("Wallet must be unlocked to sign transaction")
+        
+        # Same message and blockhash: the earlier signatures are still valid
+        if self._broadcast_cache is not None and self._broadcast_cache[0] == blockhash:
+            raw_tx, metadata = self._broadcast_cache[1]
+            return raw_tx, dict(metadata)
             
         # Convert blockhash string to Hash object
         self.recent_blockhash = Hash.from_string(blockhash)
@@ -185,8 +240,8 @@ class QuantumTransaction:
         solana_signature = self.wallet.sign_solana_transaction(transaction)
         transaction.signatures = [solana_signature]
         
-        # Calculate transaction hash using DiracHash
-        tx_hash = DiracHash.hash(message_bytes, digest_size=32, algorithm="improved")
+        # Calculate transaction hash using DiracHash (also reported as message_hash)
+        tx_hash = str(Hash.from_bytes(_DHASH(message_bytes)))
         
         # Prepare metadata with all necessary information
         metadata = {
@@ -194,9 +249,9 @@ class QuantumTransaction:
             "signature_algorithm": "dilithium",
             "security_level": 3,
             "solana_signature": str(solana_signature),
-            "transaction_hash": str(Hash.from_bytes(tx_hash)),
+            "transaction_hash": tx_hash,
             "public_key": str(self.wallet.keypair.public_key),
-            "message_hash": str(Hash.from_bytes(DiracHash.hash(message_bytes, digest_size=32, algorithm="improved"))),
+            "message_hash": tx_hash,
             "blockhash": blockhash,
             "fee_payer": str(self.fee_payer)
         }
@@ -204,6 +259,7 @@ class QuantumTransaction:
         # Serialize transaction with proper format
         raw_tx = bytes(transaction)
         
+        self._broadcast_cache = (blockhash, (raw_tx, dict(metadata)))
         return raw_tx, metadata
     
     @staticmethod
@@ -215,6 +271,9 @@ class QuantumTransaction:
         """
         Verify a quantum signature independently
         Used for off-chain verification of quantum signatures
+        
+        When the metadata carries transaction_hash, the message's DiracHash is
+        compared first and a mismatch is rejected without running Dilithium.
         """
         try:
             # Extract data
@@ -225,6 +284,10 @@ class QuantumTransaction:
             transaction = Transaction.from_bytes(raw_transaction)
             message_bytes = bytes(transaction.message)
             
+            if not QuantumTransaction._matches_transaction_hash(message_bytes, signature_metadata):
+                logger.debug("Quantum signature verification: message hash mismatch")
+                return False
+            
             # Verify signature
             if wallet:
                 key_manager = wallet.key_manager
@@ -245,4 +308,81 @@ class QuantumTransaction:
             
         except Exception as e:
             logger.error(f"Failed to verify quantum signature: {str(e)}")
-            return False
\ No newline at end of file
+            return False
+
+    @staticmethod
+    def _matches_transaction_hash(message_bytes: bytes, signature_metadata: Dict) -> bool:
+        """Check the message against metadata["transaction_hash"], if recorded"""
+        expected = signature_metadata.get("transaction_hash")
+        if expected is None:
+            return True
+        return str(Hash.from_bytes(_DHASH(message_bytes))) == expected
+
+    @staticmethod
+    def verify_quantum_signatures_batch(
+        raw_transactions: List[bytes],
+        signature_metadatas: List[Dict],
+        wallet: DiracWallet = None
+    ) -> List[bool]:
+        """
+        Verify many quantum signatures in one call
+
+        Messages are extracted in a single pass and one key manager is shared per
+        security level. A key manager exposing verify_signatures_batch gets the whole
+        group at once; otherwise signatures are verified one by one (Dilithium
+        verification holds the GIL, so threads would not run it in parallel).
+        Returns one result per transaction, in input order.
+        """
+        if len(raw_transactions) != len(signature_metadatas):
+            raise ValueError("Each raw transaction needs matching signature metadata")
+
+        results = [False] * len(raw_transactions)
+        key_managers: Dict[int, QuantumKeyManager] = {}
+        groups: Dict[int, List[Tuple[int, bytes, Dict, Dict]]] = {}
+
+        for index, (raw_transaction, metadata) in enumerate(zip(raw_transactions, signature_metadatas)):
+            try:
+                message_bytes = bytes(Transaction.from_bytes(raw_transaction).message)
+                # Tampered messages fail the hash check and never reach the verifier
+                if not QuantumTransaction._matches_transaction_hash(message_bytes, metadata):
+                    continue
+                security_level = metadata.get("security_level", 3)
+                if security_level not in key_managers:
+                    if wallet:
+                        key_managers[security_level] = wallet.key_manager
+                    else:
+                        key_managers[security_level] = QuantumKeyManager(security_level=security_level)
+                groups.setdefault(security_level, []).append(
+                    (index, message_bytes, metadata["signature"], metadata["public_key"])
+                )
+            except Exception as e:
+                logger.error(f"Failed to prepare quantum signature {index} for verification: {str(e)}")
+
+        for security_level, entries in groups.items():
+            key_manager = key_managers[security_level]
+            batch_verify = getattr(key_manager, "verify_signatures_batch", None)
+
+            if batch_verify is not None:
+                try:
+                    verified = batch_verify(
+                        [entry[1] for entry in entries],
+                        [entry[2] for entry in entries],
+                        [entry[3] for entry in entries]
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to batch-verify quantum signatures: {str(e)}")
+                    verified = [False] * len(entries)
+            else:
+                verified = []
+                for entry in entries:
+                    try:
+                        verified.append(key_manager.verify_signature(entry[1], entry[2], entry[3]))
+                    except Exception as e:
+                        logger.error(f"Failed to verify quantum signature: {str(e)}")
+                        verified.append(False)
+
+            for entry, is_valid in zip(entries, verified):
+                results[entry[0]] = bool(is_valid)
+
+        logger.debug(f"Batch quantum signature verification: {sum(results)}/{len(results)} valid")
+        return results
\ No newline at end of file
@@ -3,7 +3,9 @@ Core wallet functionality for Dirac-Wallet
 """
 import os
 import json
+import asyncio
 import getpass
+import cbor2
 from pathlib import Path
 from typing import Optional, Dict, Union, List
 from dataclasses import dataclass, asdict
@@ -11,10 +13,14 @@ from solders.signature import Signature
 
 from .keys import QuantumKeyManager, KeyPair
 from .address import AddressDerivation
-from .storage import SecureStorage
+from .storage import SecureStorage, MemoryPath, MEMORY_SCHEME
 from ..utils.logger import logger
 
 
+# Prefix marking CBOR-encoded wallet data; files without it hold legacy JSON
+WALLET_FORMAT_MAGIC = b"DWC\x01"
+
+
 @dataclass
 class WalletInfo:
     """Container for wallet information"""
@@ -58,9 +64,12 @@ class DiracWallet:
     """Main wallet class for Dirac-Wallet"""
     
     def __init__(self, wallet_path: str = None, network: str = "devnet"):
-        """Initialize wallet"""
+        """Initialize wallet; a "mem://" wallet_path keeps the file in memory"""
         self.network = network
-        self.wallet_path = Path(wallet_path) if wallet_path else self._get_default_path()
+        if wallet_path and str(wallet_path).startswith(MEMORY_SCHEME):
+            self.wallet_path = MemoryPath(str(wallet_path))
+        else:
+            self.wallet_path = Path(wallet_path) if wallet_path else self._get_default_path()
         self.key_manager = QuantumKeyManager(security_level=3)
         self.storage = SecureStorage()
         
@@ -139,51 +148,90 @@ class DiracWallet:
                 raise FileNotFoundError(f"Wallet file not found at {self.wallet_path}")
             
             encrypted_data = self.wallet_path.read_bytes()
-            try:
-                decrypted_data = self.storage.decrypt(encrypted_data, password)
-            except Exception as e:
-                # Always raise a ValueError for corrupted data or bad password
-                logger.error(f"Tampering detected or invalid password: {str(e)}")
-                raise ValueError("Invalid password or corrupted data") from e
-                
-            wallet_data = json.loads(decrypted_data.decode('utf-8'))
-            
-            # Restore wallet state
-            self.keypair = KeyPair.deserialize(wallet_data["keypair"])
-            self.wallet_info = WalletInfo.from_dict(wallet_data["info"])
-            
-            # Load transaction history if available
-            if "transaction_history" in wallet_data:
-                self.transaction_history = [
-                    TransactionRecord.from_dict(tx) for tx in wallet_data["transaction_history"]
-                ]
-            else:
-                self.transaction_history = []
-            
-            # Recreate Solana keypair
-            hybrid_keypair = AddressDerivation.create_quantum_keypair(self.keypair)
-            self.solana_keypair = hybrid_keypair["solana_keypair"]
-            self.solana_address = hybrid_keypair["solana_address"]
-            
-            self.is_unlocked = True
-            
-            logger.info(f"Wallet unlocked: {self.solana_address}")
+            decrypted_data = self._decrypt_wallet_data(encrypted_data, password)
+            self._restore_wallet_data(decrypted_data)
             return True
             
         except ValueError as ve:
             # Re-raise ValueErrors to be caught in file tampering tests
-            self.is_unlocked = False
-            self.keypair = None
-            self.solana_keypair = None
+            self._reset_unlocked_state()
             raise
         except Exception as e:
             logger.error(f"Failed to unlock wallet: {str(e)}")
             # Ensure wallet remains locked on failure
-            self.is_unlocked = False
-            self.keypair = None
-            self.solana_keypair = None
+            self._reset_unlocked_state()
+            return False
+    
+    async def unlock_async(self, password: str) -> bool:
+        """Unlock an existing wallet without blocking the event loop
+        
+        File read and PBKDF2/AES decryption run in the default executor.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            # No separate exists() check: that would stat the file on the event loop
+            try:
+                encrypted_data = await loop.run_in_executor(None, self.wallet_path.read_bytes)
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Wallet file not found at {self.wallet_path}") from None
+            
+            decrypted_data = await loop.run_in_executor(
+                None, self._decrypt_wallet_data, encrypted_data, password
+            )
+            self._restore_wallet_data(decrypted_data)
+            return True
+            
+        except ValueError:
+            self._reset_unlocked_state()
+            raise
+        except Exception as e:
+            logger.error(f"Failed to unlock wallet: {str(e)}")
+            self._reset_unlocked_state()
             return False
     
+    def _decrypt_wallet_data(self, encrypted_data: bytes, password: str) -> bytes:
+        """Decrypt wallet file contents, normalizing failures to ValueError"""
+        try:
+            return self.storage.decrypt(encrypted_data, password)
+        except Exception as e:
+            # Always raise a ValueError for corrupted data or bad password
+            logger.error(f"Tampering detected or invalid password: {str(e)}")
+            raise ValueError("Invalid password or corrupted data") from e
+    
+    def _restore_wallet_data(self, decrypted_data: bytes):
+        """Restore wallet state from decrypted wallet data"""
+        if decrypted_data.startswith(WALLET_FORMAT_MAGIC):
+            wallet_data = cbor2.loads(decrypted_data[len(WALLET_FORMAT_MAGIC):])
+        else:
+            wallet_data = json.loads(decrypted_data.decode('utf-8'))
+        
+        # Restore wallet state
+        self.keypair = KeyPair.deserialize(wallet_data["keypair"])
+        self.wallet_info = WalletInfo.from_dict(wallet_data["info"])
+        
+        # Load transaction history if available
+        if "transaction_history" in wallet_data:
+            self.transaction_history = [
+                TransactionRecord.from_dict(tx) for tx in wallet_data["transaction_history"]
+            ]
+        else:
+            self.transaction_history = []
+        
+        # Recreate Solana keypair
+        hybrid_keypair = AddressDerivation.create_quantum_keypair(self.keypair)
+        self.solana_keypair = hybrid_keypair["solana_keypair"]
+        self.solana_address = hybrid_keypair["solana_address"]
+        
+        self.is_unlocked = True
+        
+        logger.info(f"Wallet unlocked: {self.solana_address}")
+    
+    def _reset_unlocked_state(self):
+        """Keep the wallet locked after a failed unlock"""
+        self.is_unlocked = False
+        self.keypair = None
+        self.solana_keypair = None
+    
     def lock(self):
         """Lock the wallet (clear sensitive data from memory)"""
         self.keypair = None
@@ -194,31 +242,45 @@ class DiracWallet:
     def _save_encrypted(self, password: str):
         """Save wallet to encrypted file"""
         try:
-            # Prepare wallet data
-            wallet_data = {
-                "keypair": self.keypair.serialize(),
-                "info": self.wallet_info.to_dict(),
-                "transaction_history": [tx.to_dict() for tx in self.transaction_history]
-            }
-            
-            # Encrypt and save
-            encrypted_data = self.storage.encrypt(
-                json.dumps(wallet_data).encode('utf-8'),
-                password
-            )
-            
-            # Ensure directory exists
-            self.wallet_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Write encrypted file
-            self.wallet_path.write_bytes(encrypted_data)
+            self._write_encrypted(self._serialize_wallet_data(), password)
+            logger.info(f"Wallet saved to {self.wallet_path}")
             
+        except Exception as e:
+            logger.error(f"Failed to save wallet: {str(e)}")
+            raise
+    
+    async def _save_encrypted_async(self, password: str):
+        """Save wallet to encrypted file without blocking the event loop"""
+        try:
+            data = self._serialize_wallet_data()
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._write_encrypted, data, password)
             logger.info(f"Wallet saved to {self.wallet_path}")
             
         except Exception as e:
             logger.error(f"Failed to save wallet: {str(e)}")
             raise
     
+    def _serialize_wallet_data(self) -> bytes:
+        """Serialize wallet state for encryption"""
+        wallet_data = {
+            "keypair": self.keypair.serialize(binary=True),
+            "info": self.wallet_info.to_dict(),
+            "transaction_history": [tx.to_dict() for tx in self.transaction_history]
+        }
+        return WALLET_FORMAT_MAGIC + cbor2.dumps(wallet_data)
+    
+    def _write_encrypted(self, data: bytes, password: str):
+        """Encrypt serialized wallet data and write it to the wallet file"""
+        encrypted_data = self.storage.encrypt(data, password)
+        
+        # Ensure directory exists
+        if not isinstance(self.wallet_path, MemoryPath):
+            self.wallet_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Write encrypted file
+        self.wallet_path.write_bytes(encrypted_data)
+    
     def get_info(self) -> Dict:
         """Get wallet information"""
         if not self.wallet_info:
@@ -260,6 +322,17 @@ class DiracWallet:
         self._save_encrypted(password)
         logger.info("Wallet saved successfully")
     
+    async def save_async(self, password: str):
+        """Save the wallet with current state without blocking the event loop"""
+        if not self.is_unlocked:
+            raise ValueError("Wallet must be unlocked to save")
+            
+        if password is None:
+            raise ValueError("Password required to save wallet")
+            
+        await self._save_encrypted_async(password)
+        logger.info("Wallet saved successfully")
+    
     def sign_message(self, message: Union[str, bytes]) -> Dict:
         """Sign a message with the wallet's private key"""
         if not self.is_unlocked:
@@ -1,6 +1,6 @@
 """
 Network connectivity modules
 """
-from .solana_client import QuantumSolanaClient
+from .solana_client import QuantumSolanaClient, BlockhashNotFound
 
-__all__ = ['QuantumSolanaClient']
\ No newline at end of file
+__all__ = ['QuantumSolanaClient', 'BlockhashNotFound']
\ No newline at end of file
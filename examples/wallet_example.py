@@ -10,9 +10,10 @@ import time
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from solders.transaction import Transaction
 from dirac_wallet.core.wallet import DiracWallet
 from dirac_wallet.core.transactions import QuantumTransaction
-from dirac_wallet.network.solana_client import QuantumSolanaClient
+from dirac_wallet.network.solana_client import QuantumSolanaClient, BlockhashNotFound
 
 async def main():
     try:
@@ -21,126 +22,142 @@ async def main():
         wallet.create("test123")
         print(f"\nCreated wallet with address: {wallet.solana_address}")
         
-        # Initialize Solana client
-        client = QuantumSolanaClient(network="devnet")
-        connected = await client.connect()
-        if not connected:
-            print("Failed to connect to Solana network")
-            return
-        print("Connected to Solana devnet")
-        
-        # Request airdrop
-        print("\nRequesting airdrop...")
-        try:
-            airdrop_amount = 1.0  # 1 SOL
-            tx_id = await client.request_airdrop(wallet.solana_address, airdrop_amount)
-            if tx_id:
-                print(f"Airdrop requested: {tx_id}")
-                # Wait for airdrop to confirm
-                print("Waiting for airdrop confirmation...")
-                await asyncio.sleep(5)
-                
-                # Check balance
-                balance = await client.get_balance(wallet.solana_address)
-                print(f"Current balance: {balance} SOL")
+        # Initialize Solana client; the context manager connects and disconnects,
+        # and one client (with its pooled connections) serves the whole session
+        async with QuantumSolanaClient(network="devnet") as client:
+            if client.client is None:
+                print("Failed to connect to Solana network")
+                return
+            print("Connected to Solana devnet")
+            
+            # Request airdrop
+            print("\nRequesting airdrop...")
+            airdrop_lamports = 1_000_000_000  # 1 SOL
+            # Don't wait for request_airdrop (it returns only after confirmation);
+            # the credit shows up in the balance first, so start polling right away
+            airdrop_task = asyncio.create_task(
+                client.request_airdrop(wallet.solana_address, airdrop_lamports)
+            )
+            try:
+                funded = False
+                deadline = time.monotonic() + 60
+                while time.monotonic() < deadline:
+                    if await client.get_balance(wallet.solana_address) > 0:
+                        funded = True
+                        break
+                    # result() re-raises an airdrop error; None means every endpoint refused
+                    if airdrop_task.done() and airdrop_task.result() is None:
+                        break
+                    await asyncio.sleep(1)
                 
-                if balance > 0:
-                    print("\nAirdrop successful!")
+                if funded:
+                    if airdrop_task.done() and airdrop_task.exception() is None:
+                        print(f"Airdrop confirmed: {airdrop_task.result()}")
+                    else:
+                        print("Airdrop received")
                 else:
-                    print("\nAirdrop may have failed. Please try alternative methods.")
-            else:
-                print("\nAirdrop request failed. Here are alternative methods to get SOL:")
-                alternatives = await client.get_airdrop_alternatives(wallet.solana_address)
-                
-                if "web_faucets" in alternatives:
-                    print("\nWeb Faucets:")
-                    for faucet in alternatives["web_faucets"]:
-                        print(f"  - {faucet}")
-                
-                if "cli_commands" in alternatives:
-                    print("\nCLI Commands:")
-                    for cmd in alternatives["cli_commands"]:
-                        print(f"  - {cmd}")
-                
-                if "discord_faucets" in alternatives:
-                    print("\nDiscord Faucets:")
-                    for discord in alternatives["discord_faucets"]:
-                        print(f"  - {discord}")
-                
-                if "note" in alternatives:
-                    print(f"\nNote: {alternatives['note']}")
-                
-                print("\nPlease fund your wallet using one of these methods and run this script again.")
+                    print("\nAirdrop request failed. Here are alternative methods to get SOL:")
+                    alternatives = await client.get_airdrop_alternatives(wallet.solana_address)
+                    
+                    if "web_faucets" in alternatives:
+                        print("\nWeb Faucets:")
+                        for faucet in alternatives["web_faucets"]:
+                            print(f"  - {faucet}")
+                    
+                    if "cli_commands" in alternatives:
+                        print("\nCLI Commands:")
+                        for cmd in alternatives["cli_commands"]:
+                            print(f"  - {cmd}")
+                    
+                    if "discord_faucets" in alternatives:
+                        print("\nDiscord Faucets:")
+                        for discord in alternatives["discord_faucets"]:
+                            print(f"  - {discord}")
+                    
+                    if "note" in alternatives:
+                        print(f"\nNote: {alternatives['note']}")
+                    
+                    print("\nPlease fund your wallet using one of these methods and run this script again.")
+                    return
+            
+            except Exception as e:
+                print(f"\nAirdrop error: {str(e)}")
+                print("\nPlease try funding your wallet manually and run this script again.")
                 return
-                
-        except Exception as e:
-            print(f"\nAirdrop error: {str(e)}")
-            print("\nPlease try funding your wallet manually and run this script again.")
-            return
-        
-        # Check balance
-        balance = await client.get_balance(wallet.solana_address)
-        print(f"\nCurrent balance: {balance} SOL")
-        
-        if balance == 0:
-            print("No balance available. Please fund the wallet using one of the alternative methods.")
-            return
-        
-        # Create and send transaction
-        recipient = "GqhP9E3JUYFQiQhJXeZUTTi3zRQhKzk9TRoG9Uo9LBCE"
-        amount = 0.1  # 0.1 SOL
-        amount_lamports = int(amount * 10**9)
-        
-        print(f"\nSending {amount} SOL to {recipient}")
-        
-        tx = QuantumTransaction(wallet)
-        tx.create_transfer(recipient, amount_lamports)
-        
-        # Get recent blockhash
-        blockhash = await client.get_recent_blockhash()
-        if not blockhash:
-            print("Failed to get recent blockhash")
-            return
-        
-        # Prepare and send transaction
-        try:
-            raw_tx, metadata = tx.prepare_for_broadcast(str(blockhash))
-            result = await client.submit_quantum_transaction(
-                raw_tx,
-                metadata["signature"],
-                metadata
-            )
+            finally:
+                # Funds already landed (or we gave up); stop its confirmation polling
+                if not airdrop_task.done():
+                    airdrop_task.cancel()
+                    try:
+                        await airdrop_task
+                    except asyncio.CancelledError:
+                        pass
             
-            print(f"Transaction sent: {result['transaction_id']}")
+            # Check balance and fetch a blockhash in one JSON-RPC batch (one round trip)
+            balance_result, blockhash_result = await client.batch_request([
+                ("getBalance", [wallet.solana_address]),
+                ("getLatestBlockhash", [{"commitment": "confirmed"}]),
+            ])
+            balance = balance_result["value"] / client.LAMPORTS_PER_SOL
+            blockhash = blockhash_result["value"]["blockhash"]
+            last_valid_block_height = blockhash_result["value"]["lastValidBlockHeight"]
+            print(f"\nCurrent balance: {balance} SOL")
+            
+            if balance == 0:
+                print("No balance available. Please fund the wallet using one of the alternative methods.")
+                return
             
-            # Wait for confirmation
-            print("Waiting for confirmation...")
-            confirmed = False
-            for _ in range(5):  # Try for 5 attempts
-                status = await client.get_transaction_status(result["transaction_id"])
+            # Create and send transaction
+            recipient = "GqhP9E3JUYFQiQhJXeZUTTi3zRQhKzk9TRoG9Uo9LBCE"
+            amount = 0.1  # 0.1 SOL
+            amount_lamports = int(amount * 10**9)
+            
+            print(f"\nSending {amount} SOL to {recipient}")
+            
+            tx = QuantumTransaction(wallet)
+            tx.create_transfer(recipient, amount_lamports)
+            
+            # Prepare and send transaction
+            try:
+                raw_tx, metadata = tx.prepare_for_broadcast(str(blockhash))
+                
+                # Sends, then rebroadcasts the same bytes until confirmed or expired
+                print("Sending and waiting for confirmation...")
+                try:
+                    status = await client.send_and_confirm(
+                        Transaction.from_bytes(raw_tx),
+                        last_valid_block_height=last_valid_block_height
+                    )
+                except BlockhashNotFound:
+                    # Blockhash expired before it landed: re-sign once with a fresh one
+                    print("Blockhash expired, re-signing with a fresh one...")
+                    blockhash = await client.get_recent_blockhash()
+                    raw_tx, metadata = tx.prepare_for_broadcast(str(blockhash))
+                    status = await client.send_and_confirm(Transaction.from_bytes(raw_tx))
+                
+                print(f"Transaction sent: {status['signature']}")
                 if status.get("confirmed"):
                     print("Transaction confirmed!")
-                    confirmed = True
-                    break
                 elif status.get("error"):
                     print(f"Transaction failed: {status['error']}")
-                    break
-                await asyncio.sleep(2)
-            
-            if not confirmed:
-                print("Transaction confirmation timed out")
-            
-            # Check final balance
-            balance = await client.get_balance(wallet.solana_address)
-            print(f"Final balance: {balance} SOL")
+                else:
+                    print("Transaction confirmation timed out")
+                
+                # Check final balance
+                balance = await client.get_balance(wallet.solana_address)
+                print(f"Final balance: {balance} SOL")
             
-        except Exception as e:
-            print(f"Transaction error: {str(e)}")
-        
+            except Exception as e:
+                print(f"Transaction error: {str(e)}")
+    
     except Exception as e:
         print(f"Error: {str(e)}")
-    finally:
-        await client.disconnect()
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    # uvloop is optional; it speeds up the RPC round trips when installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    asyncio.run(main())
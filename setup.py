@@ -1,7 +1,7 @@
+from pathlib import Path
 from setuptools import setup, find_packages
 
-with open("README.md", "r", encoding="utf-8") as fh:
-    long_description = fh.read()
+long_description = Path(__file__).parent.joinpath("README.md").read_text(encoding="utf-8")
 
 setup(
     name="dirac-wallet",
@@ -28,6 +28,8 @@ setup(
         "psutil>=5.9.0",
         "matplotlib>=3.5.0",
         "numpy>=1.20.0",
+        "cbor2>=5.4.0",
+        "orjson>=3.6.0",
         "dirac-hashes",
     ],
     entry_points={
@@ -29,6 +29,15 @@ class TestAddressDerivation(unittest.TestCase):
         # Verify it's valid base58
         self.assertTrue(re.match(r'^[1-9A-HJ-NP-Za-km-z]+$', address))
     
+    def test_derive_solana_address_golden_vector(self):
+        """Test address derivation against a fixed input and its known address"""
+        # 2 KiB stand-in for public key bytes; no key generation needed
+        pub_key_bytes = bytes(range(256)) * 8
+        self.assertEqual(
+            AddressDerivation.derive_solana_address(pub_key_bytes),
+            "CZeq3xXcLD1E9RjuBtqZYwWsHumPZN6tmxnV392bQYXN"
+        )
+    
     def test_deterministic_address_generation(self):
         """Test that same public key generates same address"""
         keypair = self.key_manager.generate_keypair()
@@ -78,6 +87,31 @@ class TestAddressDerivation(unittest.TestCase):
         )
         self.assertFalse(is_valid_wrong)
     
+    def test_public_key_bytes_cached_on_keypair(self):
+        """Test that public key bytes are computed once per keypair"""
+        keypair = self.key_manager.generate_keypair()
+        self.assertIsNone(keypair._pub_bytes)
+        
+        hybrid = AddressDerivation.create_quantum_keypair(keypair)
+        self.assertEqual(
+            keypair._pub_bytes,
+            self.key_manager.get_public_key_bytes(keypair.public_key)
+        )
+        self.assertEqual(hybrid["keypair_info"]["public_key_size"], len(keypair._pub_bytes))
+        self.assertTrue(AddressDerivation.verify_address_mapping(keypair, hybrid["solana_address"]))
+    
+    def test_verify_address_mapping_uncached(self):
+        """Test verification re-derives the address for a fresh keypair object"""
+        keypair = self.key_manager.generate_keypair()
+        hybrid = AddressDerivation.create_quantum_keypair(keypair)
+        self.assertEqual(keypair._solana_address, hybrid["solana_address"])
+        
+        fresh = KeyPair.deserialize(keypair.serialize())
+        self.assertIsNone(fresh._solana_address)
+        self.assertTrue(AddressDerivation.verify_address_mapping(fresh, hybrid["solana_address"]))
+        self.assertEqual(fresh._solana_address, hybrid["solana_address"])
+        self.assertFalse(AddressDerivation.verify_address_mapping(fresh, "WrongAddress123456789"))
+    
     def test_different_keypairs_different_addresses(self):
         """Test that different keypairs generate different addresses"""
         keypair1 = self.key_manager.generate_keypair()
@@ -5,11 +5,22 @@ import sys
 import os
 import unittest
 import asyncio
+import time
+import json
 import tempfile
 import shutil
+import subprocess
+import urllib.request
 from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
 from solders.pubkey import Pubkey
 from solders.hash import Hash
+from solders.signature import Signature
+from solders.transaction import Transaction
+from solders.rpc.responses import (
+    SignatureNotification, SignatureNotificationResult, RpcSignatureResponse, RpcResponseContext
+)
 
 # Add the parent directory to sys.path for imports
 project_root = Path(__file__).parent.parent
@@ -17,9 +28,158 @@ sys.path.insert(0, str(project_root))
 
 from dirac_wallet.core.wallet import DiracWallet
 from dirac_wallet.core.transactions import QuantumTransaction
+from dirac_wallet.network import solana_client as solana_client_module
 from dirac_wallet.network.solana_client import QuantumSolanaClient
 
 
+class _FakeClusterRPC:
+    """Stand-in AsyncClient base reporting a cluster's genesis hash"""
+    
+    genesis = QuantumSolanaClient.GENESIS_HASHES["devnet"]
+    
+    async def get_genesis_hash(self):
+        return SimpleNamespace(value=Hash.from_string(self.genesis))
+
+
+class _FakeRPC(_FakeClusterRPC):
+    """Stand-in AsyncClient answering get_balance after a fixed delay"""
+    
+    def __init__(self, delay, value=None, error=None):
+        self.delay = delay
+        self.value = value
+        self.error = error
+        self.calls = 0
+        self.cancelled = False
+    
+    async def get_balance(self, pubkey):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error:
+            raise self.error
+        return self.value
+
+
+class _FakeBlockhashRPC(_FakeClusterRPC):
+    """Stand-in AsyncClient counting get_latest_blockhash calls"""
+    
+    def __init__(self, blockhashes=(Hash.default(),)):
+        # Successive calls return these in turn, then keep returning the last one
+        self.blockhashes = blockhashes
+        self.calls = 0
+    
+    async def get_latest_blockhash(self):
+        blockhash = self.blockhashes[min(self.calls, len(self.blockhashes) - 1)]
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return SimpleNamespace(value=SimpleNamespace(blockhash=blockhash, last_valid_block_height=150))
+
+
+class _FakeSendRPC(_FakeClusterRPC):
+    """Stand-in AsyncClient for send_raw_transaction, failing the first `failures` calls"""
+    
+    def __init__(self, failures=0, delay=0.0, error=None, block_height=0, rejected=()):
+        self.failures = failures
+        self.delay = delay
+        self.error = error
+        self.block_height = block_height
+        # Raw transactions answered with `error` even when it isn't raised for every send
+        self.rejected = rejected
+        self.sent = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+    
+    async def get_block_height(self):
+        return SimpleNamespace(value=self.block_height)
+    
+    async def send_raw_transaction(self, txn, opts=None):
+        self.sent.append((txn, opts))
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if self.error is not None and (not self.rejected or txn in self.rejected):
+            raise self.error
+        if len(self.sent) <= self.failures:
+            raise ConnectionError("connection reset")
+        return SimpleNamespace(value=Signature.new_unique())
+
+
+class _FakeJSONRPC:
+    """Stand-in HTTP session answering JSON-RPC batch POSTs with a handler"""
+    
+    def __init__(self, handler, reject_batches=False):
+        self.handler = handler
+        self.reject_batches = reject_batches
+        self.posts = []
+        self.closed = False
+    
+    def post(self, url, data=None, **kwargs):
+        calls = json.loads(data)
+        self.posts.append(calls)
+        if isinstance(calls, dict):
+            reply = {"jsonrpc": "2.0", "id": calls["id"], "result": self.handler(calls)}
+            return _FakeResponse(json.dumps(reply).encode())
+        if self.reject_batches:
+            reply = {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "batch requests are disabled"}}
+            return _FakeResponse(json.dumps(reply).encode())
+        replies = [{"jsonrpc": "2.0", "id": call["id"], "result": self.handler(call)} for call in calls]
+        return _FakeResponse(json.dumps(replies).encode())
+    
+    async def close(self):
+        self.closed = True
+
+
+class _FakeResponse:
+    """Stand-in aiohttp response context manager"""
+    
+    def __init__(self, body):
+        self.body = body
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc):
+        return False
+    
+    def raise_for_status(self):
+        pass
+    
+    async def read(self):
+        return self.body
+
+
+class _FakeWebsocket:
+    """Stand-in solana websocket pushing a canned signature notification"""
+    
+    def __init__(self, messages):
+        self.messages = messages
+        self.subscribed = []
+    
+    def __call__(self, url):
+        self.url = url
+        return self
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc):
+        return False
+    
+    async def signature_subscribe(self, signature, commitment=None):
+        self.subscribed.append((signature, commitment))
+    
+    async def recv(self):
+        if not self.messages:
+            await asyncio.sleep(3600)
+        return [self.messages.pop(0)]
+
+
 class TestNetwork(unittest.TestCase):
     
     def setUp(self):
@@ -50,6 +210,560 @@ class TestNetwork(unittest.TestCase):
         self.assertEqual(client.network, "testnet")
         self.assertEqual(client.current_endpoint, "https://api.testnet.solana.com")
     
+    def test_http_session_reused(self):
+        """Test the faucet HTTP session is shared and closed on disconnect"""
+        async def run_test():
+            session = self.solana_client._get_http()
+            self.assertIs(self.solana_client._get_http(), session)
+            await self.solana_client.disconnect()
+            self.assertTrue(session.closed)
+            self.assertIsNone(self.solana_client._http)
+        
+        asyncio.run(run_test())
+    
+    def test_client_reused_per_endpoint(self):
+        """Test one AsyncClient is kept per endpoint and closed on disconnect"""
+        async def run_test():
+            endpoints = self.solana_client.RPC_ENDPOINTS["devnet"]
+            self.assertIsNone(self.solana_client.client)
+            
+            primary = self.solana_client._get_client(endpoints[0])
+            self.assertIs(self.solana_client._get_client(endpoints[0]), primary)
+            self.assertIs(self.solana_client.client, primary)
+            backup = self.solana_client._get_client(endpoints[1])
+            self.assertIsNot(backup, primary)
+            
+            await self.solana_client.disconnect()
+            self.assertEqual(self.solana_client._clients, {})
+            self.assertIsNone(self.solana_client.client)
+        
+        asyncio.run(run_test())
+    
+    def test_hedged_request(self):
+        """Test hedged reads return the first success and cancel the rest"""
+        async def run_test():
+            endpoints = self.solana_client.RPC_ENDPOINTS["devnet"]
+            slow, fast, unused = _FakeRPC(1.0, "slow"), _FakeRPC(0.0, "fast"), _FakeRPC(0.0, "unused")
+            self.solana_client._clients = dict(zip(endpoints, [slow, fast, unused]))
+            result = await self.solana_client._hedged("get_balance", None, delay=0.01, max_parallel=3)
+            self.assertEqual(result, "fast")
+            self.assertTrue(slow.cancelled)
+            self.assertEqual(unused.calls, 0)
+            
+            # A failing primary hands over to the next endpoint without waiting
+            broken, backup = _FakeRPC(0.0, error=ValueError("down")), _FakeRPC(0.0, "backup")
+            self.solana_client._clients = dict(zip(endpoints, [broken, backup]))
+            result = await self.solana_client._hedged("get_balance", None, delay=10, max_parallel=2)
+            self.assertEqual(result, "backup")
+            
+            with self.assertRaises(ValueError):
+                await self.solana_client._hedged("get_balance", None, max_parallel=1)
+        
+        asyncio.run(run_test())
+    
+    def test_hedging_stays_on_cluster(self):
+        """Test hedged reads never use an endpoint serving another cluster"""
+        endpoints = self.solana_client.RPC_ENDPOINTS
+        for network, urls in endpoints.items():
+            for other, other_urls in endpoints.items():
+                if other != network:
+                    self.assertFalse(set(urls) & set(other_urls), f"{network} shares hosts with {other}")
+        
+        async def run_test():
+            devnet = endpoints["devnet"]
+            slow, foreign, backup = _FakeRPC(1.0, "slow"), _FakeRPC(0.0, "mainnet"), _FakeRPC(0.05, "devnet")
+            foreign.genesis = QuantumSolanaClient.GENESIS_HASHES["mainnet"]
+            self.solana_client._clients = dict(zip(devnet, [slow, foreign, backup]))
+            result = await self.solana_client._hedged("get_balance", None, delay=0.01, max_parallel=3)
+            self.assertEqual(result, "devnet")
+            self.assertEqual(foreign.calls, 0)
+            self.assertNotIn(devnet[1], self.solana_client._hedge_endpoints(devnet[0]))
+        
+        asyncio.run(run_test())
+    
+    def test_bulkhead_limits_concurrency(self):
+        """Test in-flight RPC calls per endpoint never exceed bulkhead_limit"""
+        client = QuantumSolanaClient(network="devnet", bulkhead_limit=2)
+        in_flight, peak = 0, 0
+
+        async def rpc_call():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return True
+
+        async def run_test():
+            results = await asyncio.gather(*(client._dispatch(client.current_endpoint, rpc_call) for _ in range(6)))
+            self.assertEqual(results, [True] * 6)
+            self.assertEqual(peak, 2)
+
+        asyncio.run(run_test())
+
+    def test_recent_blockhash_cached(self):
+        """Test concurrent blockhash requests share one RPC and results are cached"""
+        async def run_test():
+            rpc = _FakeBlockhashRPC()
+            self.solana_client._clients = {self.solana_client.current_endpoint: rpc}
+            
+            results = await asyncio.gather(*(self.solana_client.get_recent_blockhash() for _ in range(5)))
+            self.assertEqual(results, [Hash.default()] * 5)
+            self.assertEqual(rpc.calls, 1)
+            self.assertEqual(self.solana_client._bh_last_valid[str(Hash.default())], 150)
+            
+            await self.solana_client.get_recent_blockhash()
+            self.assertEqual(rpc.calls, 1)
+            
+            # Expired entries are refreshed
+            self.solana_client._bh_ttl = 0
+            await self.solana_client.get_recent_blockhash()
+            self.assertEqual(rpc.calls, 2)
+        
+        asyncio.run(run_test())
+
+    def test_repeat_transfer_gets_fresh_blockhash(self):
+        """Test an identical transfer signed twice is detected and re-signed with a new blockhash"""
+        async def run_test():
+            client = self.solana_client
+            fresh = Hash.new_unique()
+            rpc = _FakeBlockhashRPC(blockhashes=(Hash.default(), Hash.default(), fresh))
+            endpoints = client.RPC_ENDPOINTS["devnet"][:client.WRITE_FANOUT]
+            client._clients = dict(zip(endpoints, [rpc] + [_FakeSendRPC() for _ in endpoints[1:]]))
+            client.BH_REFRESH_INTERVAL = 0
+            
+            def sign(blockhash):
+                tx = QuantumTransaction(self.wallet)
+                tx.create_transfer(self.recipient, self.amount)
+                raw_tx, _ = tx.prepare_for_broadcast(str(blockhash))
+                return Transaction.from_bytes(raw_tx)
+            
+            blockhash = await client.get_recent_blockhash()
+            first = sign(blockhash)
+            self.assertFalse(client.already_submitted(first))
+            rpc.send_raw_transaction = _FakeSendRPC().send_raw_transaction
+            await client.submit_quantum_transaction(first)
+            
+            # Same transfer within the cache window: same bytes, so fetch a new blockhash
+            second = sign(await client.get_recent_blockhash())
+            self.assertEqual(bytes(second), bytes(first))
+            self.assertTrue(client.already_submitted(second))
+            
+            blockhash = await client.get_recent_blockhash(refresh=True)
+            self.assertEqual(blockhash, fresh)
+            self.assertEqual(rpc.calls, 3)
+            second = sign(blockhash)
+            self.assertNotEqual(second.signatures[0], first.signatures[0])
+            self.assertFalse(client.already_submitted(second))
+        
+        asyncio.run(run_test())
+
+    def test_get_balances_batched(self):
+        """Test multi-address balances use batched getMultipleAccounts calls"""
+        addresses = [str(Pubkey.new_unique()) for _ in range(250)]
+        
+        def handler(call):
+            self.assertEqual(call["method"], "getMultipleAccounts")
+            keys = call["params"][0]
+            return {"value": [None if key == addresses[0] else {"lamports": 5 * 10**8} for key in keys]}
+        
+        async def run_test():
+            http = _FakeJSONRPC(handler)
+            self.solana_client._http = http
+            balances = await self.solana_client.get_balances(addresses)
+            self.assertEqual(len(http.posts), 1)
+            self.assertEqual([len(call["params"][0]) for call in http.posts[0]], [100, 100, 50])
+            self.assertEqual(balances[addresses[0]], 0.0)
+            self.assertEqual(balances[addresses[-1]], 0.5)
+            self.assertEqual(len(balances), 250)
+        
+        asyncio.run(run_test())
+    
+    def test_batch_request(self):
+        """Test batch_request returns results in order and falls back when batches are refused"""
+        def handler(call):
+            return {"method": call["method"], "params": call["params"]}
+        
+        methods = [("getBalance", ["a"]), ("getLatestBlockhash", []), ("getBalance", ["b"])]
+        
+        async def run_test():
+            http = _FakeJSONRPC(handler)
+            self.solana_client._http = http
+            results = await self.solana_client.batch_request(methods)
+            self.assertEqual([(r["method"], r["params"]) for r in results], [(m, list(p)) for m, p in methods])
+            self.assertEqual(len(http.posts), 1)
+            
+            http = _FakeJSONRPC(handler, reject_batches=True)
+            self.solana_client._http = http
+            results = await self.solana_client.batch_request(methods)
+            self.assertEqual([(r["method"], r["params"]) for r in results], [(m, list(p)) for m, p in methods])
+            self.assertEqual(len(http.posts), 1 + len(methods))
+        
+        asyncio.run(run_test())
+    
+    def test_get_balance_micro_batching(self):
+        """Test get_balance calls in one batch window share a single JSON-RPC POST"""
+        client = QuantumSolanaClient(network="devnet", batch_requests=True)
+        addresses = [str(Pubkey.new_unique()) for _ in range(5)]
+        
+        def handler(call):
+            self.assertEqual(call["method"], "getBalance")
+            return {"context": {"slot": 1}, "value": (addresses.index(call["params"][0]) + 1) * 10**9}
+        
+        async def run_test():
+            http = _FakeJSONRPC(handler)
+            client._http = http
+            client._clients = {client.current_endpoint: SimpleNamespace()}
+            balances = await asyncio.gather(*(client.get_balance(address) for address in addresses))
+            self.assertEqual(balances, [1.0, 2.0, 3.0, 4.0, 5.0])
+            self.assertEqual(len(http.posts), 1)
+            self.assertEqual(len(http.posts[0]), 5)
+            
+            await client.disconnect()
+            self.assertIsNone(client._batch_flusher)
+        
+        asyncio.run(run_test())
+    
+    def test_get_transaction_statuses_batched(self):
+        """Test multi-transaction status lookups use one getSignatureStatuses call"""
+        tx_ids = [str(Signature.new_unique()) for _ in range(3)]
+        
+        def handler(call):
+            self.assertEqual(call["method"], "getSignatureStatuses")
+            return {"value": [
+                {"slot": 7, "err": None, "confirmationStatus": "finalized"},
+                {"slot": 8, "err": {"InstructionError": [0, "Custom"]}, "confirmationStatus": "confirmed"},
+                None
+            ]}
+        
+        async def run_test():
+            http = _FakeJSONRPC(handler)
+            self.solana_client._http = http
+            statuses = await self.solana_client.get_transaction_statuses(tx_ids)
+            self.assertEqual(len(http.posts), 1)
+            self.assertEqual(statuses[tx_ids[0]], {"confirmed": True, "slot": 7, "error": None})
+            self.assertFalse(statuses[tx_ids[1]]["confirmed"])
+            self.assertIsNotNone(statuses[tx_ids[1]]["error"])
+            self.assertEqual(statuses[tx_ids[2]], {"confirmed": False, "slot": None, "error": None})
+        
+        asyncio.run(run_test())
+    
+    def test_ws_endpoint(self):
+        """Test websocket URLs follow the RPC scheme and the port+1 PubSub convention"""
+        self.assertEqual(QuantumSolanaClient._ws_endpoint("https://api.devnet.solana.com"),
+                         "wss://api.devnet.solana.com")
+        local = QuantumSolanaClient(network="local")
+        self.assertEqual(local.current_endpoint, "http://localhost:8899")
+        self.assertEqual(QuantumSolanaClient._ws_endpoint(local.current_endpoint), "ws://localhost:8900")
+    
+    def test_await_confirmation_websocket(self):
+        """Test confirmation is taken from the signatureSubscribe push"""
+        tx_id = str(Signature.new_unique())
+        notification = SignatureNotification(
+            SignatureNotificationResult(RpcSignatureResponse(None), RpcResponseContext(42)), 1
+        )
+        websocket = _FakeWebsocket(["subscribed", notification])
+        
+        async def run_test():
+            self.solana_client._http = _FakeJSONRPC(lambda call: {"value": [None]})
+            with mock.patch.object(solana_client_module, "ws_connect", websocket):
+                status = await self.solana_client.await_confirmation(tx_id, timeout=5)
+            self.assertEqual(status, {"confirmed": True, "slot": 42, "error": None})
+            self.assertEqual(websocket.url, "wss://api.devnet.solana.com")
+            self.assertEqual(websocket.subscribed, [(Signature.from_string(tx_id), "confirmed")])
+        
+        asyncio.run(run_test())
+    
+    def test_await_confirmation_already_confirmed(self):
+        """Test a transaction confirmed before subscribing is returned without waiting"""
+        tx_id = str(Signature.new_unique())
+        websocket = _FakeWebsocket([])
+        statuses = {"value": [{"slot": 7, "err": None, "confirmationStatus": "confirmed"}]}
+        
+        async def run_test():
+            self.solana_client._http = _FakeJSONRPC(lambda call: statuses)
+            with mock.patch.object(solana_client_module, "ws_connect", websocket):
+                status = await asyncio.wait_for(self.solana_client.await_confirmation(tx_id, timeout=30), 1)
+            self.assertEqual(status, {"confirmed": True, "slot": 7, "error": None})
+            
+            # Nothing confirmed and no notification: the timeout result keeps the dict shape
+            self.solana_client._http = _FakeJSONRPC(lambda call: {"value": [None]})
+            with mock.patch.object(solana_client_module, "ws_connect", _FakeWebsocket([])):
+                status = await self.solana_client.await_confirmation(tx_id, timeout=0.05)
+            self.assertEqual(status, {"confirmed": False, "slot": None, "error": "Transaction confirmation timed out"})
+        
+        asyncio.run(run_test())
+    
+    def test_submit_skips_preflight_and_retries(self):
+        """Test submission fans out, skips preflight, keeps node retries and resends on transport errors"""
+        tx = QuantumTransaction(self.wallet)
+        tx.create_transfer(self.recipient, self.amount)
+        raw_tx, _ = tx.prepare_for_broadcast(str(Hash.default()))
+        transaction = Transaction.from_bytes(raw_tx)
+        
+        async def run_test():
+            endpoints = self.solana_client.RPC_ENDPOINTS["devnet"][:self.solana_client.WRITE_FANOUT]
+            rpcs = [_FakeSendRPC(failures=1) for _ in endpoints]
+            self.solana_client._clients = dict(zip(endpoints, rpcs))
+            self.solana_client.BACKOFF_BASE = 0
+            result = await self.solana_client.submit_quantum_transaction(transaction)
+            self.assertEqual(result["status"], "submitted")
+            
+            # Every endpoint got the same bytes; all failed once, then the resend landed
+            for rpc in rpcs:
+                self.assertGreaterEqual(len(rpc.sent), 1)
+                self.assertTrue(all(sent == raw_tx for sent, _ in rpc.sent))
+            sent_bytes, opts = rpcs[0].sent[-1]
+            self.assertEqual(len(rpcs[0].sent), 2)
+            self.assertTrue(opts.skip_preflight)
+            # The node keeps rebroadcasting unless the caller takes that over
+            self.assertIsNone(opts.max_retries)
+            
+            await self.solana_client.submit_quantum_transaction(transaction, skip_preflight=False)
+            self.assertFalse(rpcs[0].sent[-1][1].skip_preflight)
+        
+        asyncio.run(run_test())
+    
+    def test_send_and_confirm_rebroadcasts(self):
+        """Test unconfirmed transactions are resent, without node retries, until they land"""
+        tx = QuantumTransaction(self.wallet)
+        tx.create_transfer(self.recipient, self.amount)
+        raw_tx, _ = tx.prepare_for_broadcast(str(Hash.default()))
+        transaction = Transaction.from_bytes(raw_tx)
+        lookups = []
+        
+        def handler(call):
+            lookups.append(call)
+            if len(lookups) < 3:
+                return {"value": [None]}
+            return {"value": [{"slot": 9, "err": None, "confirmationStatus": "confirmed"}]}
+        
+        async def run_test():
+            client = self.solana_client
+            endpoints = client.RPC_ENDPOINTS["devnet"][:client.WRITE_FANOUT]
+            rpcs = [_FakeSendRPC(block_height=100) for _ in endpoints]
+            client._clients = dict(zip(endpoints, rpcs))
+            client._http = _FakeJSONRPC(handler)
+            client.BACKOFF_BASE = 0
+            
+            status = await client.send_and_confirm(transaction, last_valid_block_height=200)
+            self.assertTrue(status["confirmed"])
+            self.assertEqual(status["slot"], 9)
+            # First send plus one resend per unconfirmed lookup, all the same bytes
+            self.assertEqual(len(rpcs[0].sent), 3)
+            self.assertTrue(all(sent == raw_tx and opts.max_retries == 0 for sent, opts in rpcs[0].sent))
+        
+        asyncio.run(run_test())
+    
+    def test_send_and_confirm_blockhash_expired(self):
+        """Test an expired blockhash is detected from block height with default (no-preflight) options"""
+        tx = QuantumTransaction(self.wallet)
+        tx.create_transfer(self.recipient, self.amount)
+        raw_tx, _ = tx.prepare_for_broadcast(str(Hash.default()))
+        transaction = Transaction.from_bytes(raw_tx)
+        
+        async def run_test():
+            client = self.solana_client
+            endpoints = client.RPC_ENDPOINTS["devnet"][:client.WRITE_FANOUT]
+            # Nodes accept the bytes (no preflight) but the transaction never lands
+            rpcs = [_FakeSendRPC(block_height=151) for _ in endpoints]
+            client._clients = dict(zip(endpoints, rpcs))
+            client._http = _FakeJSONRPC(lambda call: {"value": [None]})
+            client.BACKOFF_BASE = 0
+            client._bh_cache = (Hash.default(), time.monotonic())
+            client._bh_last_valid[str(Hash.default())] = 150
+            
+            with self.assertRaises(solana_client_module.BlockhashNotFound):
+                await client.send_and_confirm(transaction)
+            self.assertIsNone(client._bh_cache)
+            self.assertTrue(rpcs[0].sent[0][1].skip_preflight)
+        
+        asyncio.run(run_test())
+    
+    def test_submit_many(self):
+        """Test several transactions are submitted concurrently, results in input order"""
+        transactions = []
+        for amount in (self.amount, self.amount * 2, self.amount * 3):
+            tx = QuantumTransaction(self.wallet)
+            tx.create_transfer(self.recipient, amount)
+            raw_tx, _ = tx.prepare_for_broadcast(str(Hash.default()))
+            transactions.append(Transaction.from_bytes(raw_tx))
+        
+        async def run_test():
+            endpoints = self.solana_client.RPC_ENDPOINTS["devnet"][:self.solana_client.WRITE_FANOUT]
+            rpcs = [_FakeSendRPC(delay=0.05) for _ in endpoints]
+            self.solana_client._clients = dict(zip(endpoints, rpcs))
+            
+            results = await self.solana_client.submit_many(transactions)
+            # All three sends were in flight at once instead of running back to back
+            self.assertEqual(rpcs[0].peak_in_flight, 3)
+            self.assertEqual([r["status"] for r in results], ["submitted"] * 3)
+            self.assertEqual(sorted(sent for sent, _ in rpcs[0].sent),
+                             sorted(bytes(transaction) for transaction in transactions))
+            
+            # A rejected transaction is reported in place; its siblings still land
+            error = solana_client_module.RpcException("Transaction simulation failed")
+            for rpc in rpcs:
+                rpc.error = error
+                rpc.rejected = {bytes(transactions[1])}
+            results = await self.solana_client.submit_many(transactions)
+            self.assertIs(results[1], error)
+            self.assertEqual([results[0]["status"], results[2]["status"]], ["submitted"] * 2)
+        
+        asyncio.run(run_test())
+    
+    def test_blockhash_not_found_invalidates_cache(self):
+        """Test an expired blockhash rejection drops the cached blockhash and is raised"""
+        tx = QuantumTransaction(self.wallet)
+        tx.create_transfer(self.recipient, self.amount)
+        raw_tx, _ = tx.prepare_for_broadcast(str(Hash.default()))
+        transaction = Transaction.from_bytes(raw_tx)
+        
+        async def run_test():
+            endpoints = self.solana_client.RPC_ENDPOINTS["devnet"][:self.solana_client.WRITE_FANOUT]
+            error = solana_client_module.RpcException("Transaction simulation failed: Blockhash not found")
+            rpcs = [_FakeSendRPC(error=error) for _ in endpoints]
+            self.solana_client._clients = dict(zip(endpoints, rpcs))
+            self.solana_client._bh_cache = (Hash.default(), time.monotonic())
+            
+            with self.assertRaises(solana_client_module.BlockhashNotFound):
+                await self.solana_client.submit_quantum_transaction(transaction, skip_preflight=False)
+            self.assertIsNone(self.solana_client._bh_cache)
+            # Node rejections are not resent
+            self.assertEqual(len(rpcs[0].sent), 1)
+        
+        asyncio.run(run_test())
+    
+    def test_node_rejection_keeps_breakers_closed(self):
+        """Test rejected submissions don't count as endpoint failures, transport errors do"""
+        tx = QuantumTransaction(self.wallet)
+        tx.create_transfer(self.recipient, self.amount)
+        raw_tx, _ = tx.prepare_for_broadcast(str(Hash.default()))
+        transaction = Transaction.from_bytes(raw_tx)
+        
+        async def run_test():
+            client = self.solana_client
+            endpoints = client.RPC_ENDPOINTS["devnet"][:client.WRITE_FANOUT]
+            error = solana_client_module.RpcException("Transaction simulation failed: insufficient funds")
+            rpcs = [_FakeSendRPC(error=error) for _ in endpoints]
+            client._clients = dict(zip(endpoints, rpcs))
+            for _ in range(client.BREAKER_THRESHOLD + 1):
+                with self.assertRaises(solana_client_module.RpcException):
+                    await client.submit_quantum_transaction(transaction)
+            self.assertEqual({client._breaker_state(url) for url in endpoints}, {"CLOSED"})
+            
+            for rpc in rpcs:
+                rpc.error = ConnectionError("connection reset")
+            client.BACKOFF_BASE = 0
+            client.SUBMIT_RETRIES = client.BREAKER_THRESHOLD - 1
+            with self.assertRaises(ConnectionError):
+                await client.submit_quantum_transaction(transaction)
+            self.assertEqual({client._breaker_state(url) for url in endpoints}, {"OPEN"})
+        
+        asyncio.run(run_test())
+    
+    def test_concurrent_identical_submits_deduplicated(self):
+        """Test racing submissions of the same bytes share one in-flight send"""
+        tx = QuantumTransaction(self.wallet)
+        tx.create_transfer(self.recipient, self.amount)
+        raw_tx, _ = tx.prepare_for_broadcast(str(Hash.default()))
+        transaction = Transaction.from_bytes(raw_tx)
+        
+        async def run_test():
+            endpoints = self.solana_client.RPC_ENDPOINTS["devnet"][:self.solana_client.WRITE_FANOUT]
+            rpcs = [_FakeSendRPC(delay=0.02) for _ in endpoints]
+            self.solana_client._clients = dict(zip(endpoints, rpcs))
+            results = await asyncio.gather(
+                *(self.solana_client.submit_quantum_transaction(transaction) for _ in range(4))
+            )
+            self.assertEqual(len({result["signature"] for result in results}), 1)
+            self.assertEqual([len(rpc.sent) for rpc in rpcs], [1] * len(rpcs))
+            self.assertEqual(self.solana_client._inflight_tx, {})
+        
+        asyncio.run(run_test())
+    
+    def test_circuit_breaker(self):
+        """Test endpoints open after repeated failures and admit one probe after cool-down"""
+        client = self.solana_client
+        primary, backup = client.RPC_ENDPOINTS["devnet"][:2]
+
+        for _ in range(client.BREAKER_THRESHOLD):
+            self.assertTrue(client._endpoint_allowed(primary))
+            client._record_failure(primary)
+        self.assertEqual(client._breaker_state(primary), "OPEN")
+        self.assertFalse(client._endpoint_allowed(primary))
+        self.assertNotIn(primary, client._hedge_endpoints(backup))
+
+        # Fallback skips the open endpoint
+        self.assertTrue(client._advance_endpoint())
+        self.assertEqual(client.current_endpoint, backup)
+
+        # After the cool-down a single probe is let through
+        client._endpoint_state[primary]["open_until"] = 0.0
+        self.assertEqual(client._breaker_state(primary), "HALF_OPEN")
+        self.assertTrue(client._endpoint_allowed(primary))
+        self.assertFalse(client._endpoint_allowed(primary))
+
+        client._record_success(primary)
+        self.assertEqual(client._breaker_state(primary), "CLOSED")
+
+    def test_health_weighted_fallback(self):
+        """Test fallback picks the lowest-latency endpoint and stats are exposed"""
+        client = self.solana_client
+        endpoints = client.RPC_ENDPOINTS["devnet"]
+
+        async def ok():
+            return True
+
+        async def fail():
+            raise ConnectionError("down")
+
+        async def run_test():
+            await client._dispatch(endpoints[0], ok)
+            with self.assertRaises(ConnectionError):
+                await client._dispatch(endpoints[0], fail)
+
+        asyncio.run(run_test())
+        stats = client.get_provider_stats()[endpoints[0]]
+        self.assertEqual((stats["wins"], stats["errors"]), (1, 1))
+        self.assertEqual(stats["state"], "CLOSED")
+        self.assertLess(stats["ewma_ms"], client.STATS_INITIAL_MS)
+
+        client._provider_stats(endpoints[1])["ewma_ms"] = 300.0
+        client._provider_stats(endpoints[2])["ewma_ms"] = 20.0
+        self.assertEqual(client._hedge_endpoints(endpoints[0], 2)[0], endpoints[2])
+        self.assertTrue(client._advance_endpoint())
+        self.assertEqual(client.current_endpoint, endpoints[2])
+        self.assertEqual(client.current_endpoint_index, 2)
+
+    def test_fallback_stays_on_cluster(self):
+        """Test fallback never switches to an endpoint that failed the genesis check"""
+        client = self.solana_client
+        endpoints = client.RPC_ENDPOINTS["devnet"]
+        foreign = _FakeRPC(0.0)
+        foreign.genesis = QuantumSolanaClient.GENESIS_HASHES["mainnet"]
+        client._clients = {endpoints[1]: foreign}
+        
+        with self.assertRaises(ValueError):
+            asyncio.run(client._ensure_cluster(endpoints[1]))
+        
+        # Fastest by EWMA, but on the wrong cluster
+        client._provider_stats(endpoints[1])["ewma_ms"] = 1.0
+        client._provider_stats(endpoints[2])["ewma_ms"] = 50.0
+        self.assertTrue(client._advance_endpoint())
+        self.assertEqual(client.current_endpoint, endpoints[2])
+        for _ in range(len(endpoints)):
+            client._advance_endpoint()
+            self.assertNotEqual(client.current_endpoint, endpoints[1])
+    
+    def test_backoff_delay(self):
+        """Test retry backoff grows exponentially and stays under the cap"""
+        client = self.solana_client
+        for attempt in range(12):
+            ceiling = min(client.BACKOFF_CAP, client.BACKOFF_BASE * 2 ** attempt)
+            for _ in range(20):
+                self.assertTrue(0 <= client._backoff_delay(attempt) <= ceiling)
+
     def test_connect_to_network(self):
         """Test connecting to Solana network"""
         async def run_test():
@@ -86,6 +800,14 @@ class TestNetwork(unittest.TestCase):
         except Exception as e:
             self.skipTest(f"Blockhash test skipped: {str(e)}")
     
+    def test_request_airdrop_rejects_sol_amount(self):
+        """Test a SOL (float) amount is rejected instead of failing on every endpoint"""
+        async def run_test():
+            with self.assertRaises(TypeError):
+                await self.solana_client.request_airdrop(self.wallet.solana_address, 0.5)
+        
+        asyncio.run(run_test())
+    
     def test_request_airdrop(self):
         """Test requesting airdrop"""
         async def run_test():
@@ -95,7 +817,7 @@ class TestNetwork(unittest.TestCase):
                 # Request airdrop
                 tx_id = await self.solana_client.request_airdrop(
                     self.wallet.solana_address,
-                    0.1  # 0.1 SOL
+                    100_000_000  # 0.1 SOL
                 )
                 
                 self.assertIsNotNone(tx_id)
@@ -152,5 +874,78 @@ class TestNetwork(unittest.TestCase):
         asyncio.run(run_test())
 
 
+LOCAL_VALIDATOR_URL = "http://localhost:8899"
+
+
+def _validator_healthy(url: str) -> bool:
+    """True once the validator answers getHealth with "ok" """
+    body = json.dumps({"jsonrpc": "2.0", "id": 1, "method": "getHealth"}).encode()
+    request = urllib.request.Request(url, data=body, headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(request, timeout=1) as response:
+            return json.loads(response.read()).get("result") == "ok"
+    except (OSError, ValueError):
+        return False
+
+
+@unittest.skipUnless(shutil.which("solana-test-validator"), "solana-test-validator not installed")
+class TestLocalValidator(unittest.TestCase):
+    """Integration tests against a throwaway solana-test-validator"""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Start the validator on a fresh ledger and wait until it is healthy"""
+        cls.ledger_dir = tempfile.mkdtemp()
+        cls.process = subprocess.Popen(
+            ["solana-test-validator", "--quiet", "--reset", "--ledger", cls.ledger_dir],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        deadline = time.monotonic() + 60
+        while not _validator_healthy(LOCAL_VALIDATOR_URL):
+            if cls.process.poll() is not None or time.monotonic() > deadline:
+                cls.tearDownClass()
+                raise unittest.SkipTest("solana-test-validator did not become healthy")
+            time.sleep(0.25)
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the validator and remove its ledger"""
+        cls.process.terminate()
+        try:
+            cls.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            cls.process.kill()
+        shutil.rmtree(cls.ledger_dir, ignore_errors=True)
+    
+    def setUp(self):
+        """Set up a fresh wallet for each test"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.wallet = DiracWallet(os.path.join(self.temp_dir, "local_wallet.dwf"), network="local")
+        self.wallet.create("test_password_123")
+        self.recipient = "GqhP9E3JUYFQiQhJXeZUTTi3zRQhKzk9TRoG9Uo9LBCE"
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_local_validator_transfer(self):
+        """Airdrop, transfer and confirm against the local validator"""
+        async def run_test():
+            async with QuantumSolanaClient(network="local", endpoint=LOCAL_VALIDATOR_URL) as client:
+                self.assertTrue(await client.request_airdrop(self.wallet.solana_address, 1_000_000_000))
+                self.assertEqual(await client.get_balance(self.wallet.solana_address), 1.0)
+                
+                tx = QuantumTransaction(self.wallet)
+                tx.create_transfer(self.recipient, 100_000_000)
+                raw_tx, _ = tx.prepare_for_broadcast(str(await client.get_recent_blockhash()))
+                result = await client.submit_quantum_transaction(Transaction.from_bytes(raw_tx))
+                status = await client.await_confirmation(result["signature"], timeout=30)
+                self.assertTrue(status.get("confirmed"))
+                self.assertEqual(await client.get_balance(self.recipient), 0.1)
+        
+        asyncio.run(run_test())
+
+
 if __name__ == "__main__":
     unittest.main()
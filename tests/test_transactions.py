@@ -3,9 +3,9 @@ Test transaction handling - Complete version
 """
 import sys
 import os
+import subprocess
 import unittest
-import tempfile
-import shutil
+from unittest import mock
 from pathlib import Path
 
 # Add the parent directory to sys.path for imports
@@ -20,30 +20,41 @@ from solders.message import Message
 from solders.system_program import ID as SYSTEM_PROGRAM_ID
 from dirac_wallet.core.wallet import DiracWallet
 from dirac_wallet.core.transactions import QuantumTransaction
+from dirac_wallet.core import _dirac_mix
+from quantum_hash import DiracHash
 from dirac_wallet.network.solana_client import QuantumSolanaClient
 
+# Parsed once; create_transfer takes the Pubkey directly
+RECIPIENT_PUBKEY = Pubkey.from_string("GqhP9E3JUYFQiQhJXeZUTTi3zRQhKzk9TRoG9Uo9LBCE")
+
 class TestTransactions(unittest.TestCase):
     
-    def setUp(self):
-        # Create temporary directory for test wallet
-        self.test_dir = tempfile.mkdtemp()
-        self.wallet_path = Path(self.test_dir) / "test_wallet.dwf"
-        self.test_password = "test_password_123"
+    @classmethod
+    def setUpClass(cls):
+        # In-memory wallet file; nothing is written to disk
+        cls.wallet_path = "mem://test_transactions.dwf"
+        cls.test_password = "test_password_123"
         
-        # Create and unlock wallet
-        self.wallet = DiracWallet(str(self.wallet_path))
-        self.wallet.create(self.test_password)
+        # Create and unlock wallet once; key generation is the slow step
+        cls.wallet = DiracWallet(cls.wallet_path)
+        cls.wallet.create(cls.test_password)
         
         # Initialize Solana client
-        self.solana_client = QuantumSolanaClient(network="devnet")
+        cls.solana_client = QuantumSolanaClient(network="devnet")
         
         # Test recipient address
-        self.recipient = "GqhP9E3JUYFQiQhJXeZUTTi3zRQhKzk9TRoG9Uo9LBCE"
-        self.amount = 100_000_000  # 0.1 SOL
+        cls.recipient = RECIPIENT_PUBKEY
+        cls.amount = 100_000_000  # 0.1 SOL
     
-    def tearDown(self):
-        # Clean up temporary directory
-        shutil.rmtree(self.test_dir)
+    @classmethod
+    def tearDownClass(cls):
+        # Drop the in-memory wallet file
+        cls.wallet.wallet_path.unlink(missing_ok=True)
+    
+    def setUp(self):
+        # Tests that lock the shared wallet leave it for the next one to re-unlock
+        if not self.wallet.is_unlocked:
+            self.assertTrue(self.wallet.unlock(self.test_password))
     
     def test_create_transaction(self):
         """Test creating a quantum transaction"""
@@ -68,7 +79,7 @@ class TestTransactions(unittest.TestCase):
         self.assertEqual(instruction.program_id, SYSTEM_PROGRAM_ID)
         self.assertEqual(len(instruction.accounts), 2)
         self.assertEqual(instruction.accounts[0].pubkey, tx.fee_payer)
-        self.assertEqual(str(instruction.accounts[1].pubkey), self.recipient)
+        self.assertEqual(instruction.accounts[1].pubkey, self.recipient)
     
     def test_build_message(self):
         """Test building transaction message"""
@@ -106,6 +117,19 @@ class TestTransactions(unittest.TestCase):
         self.assertIn("signature", metadata)
         self.assertEqual(metadata["signature_algorithm"], "dilithium")
     
+    def test_sign_transaction_message_bytes(self):
+        """Test sign_transaction signs the canonical message for the given blockhash"""
+        tx = QuantumTransaction(self.wallet)
+        tx.create_transfer(self.recipient, self.amount)
+        
+        blockhash = Hash.default()
+        tx_info = tx.sign_transaction(str(blockhash))
+        
+        self.assertEqual(tx.recent_blockhash, blockhash)
+        self.assertEqual(tx_info.raw_transaction, bytes(tx.build_message()))
+        self.assertEqual(tx_info.amount, self.amount)
+        self.assertEqual(tx_info.recipient, str(self.recipient))
+    
     def test_prepare_for_broadcast(self):
         """Test preparing transaction for broadcast"""
         tx = QuantumTransaction(self.wallet)
@@ -127,6 +151,41 @@ class TestTransactions(unittest.TestCase):
         self.assertIn("transaction_hash", metadata)
         self.assertEqual(metadata["signature_algorithm"], "dilithium")
     
+    def test_message_and_broadcast_cached(self):
+        """Test the built message and signed bytes are reused until the transaction changes"""
+        tx = QuantumTransaction(self.wallet)
+        tx.create_transfer(self.recipient, self.amount)
+        tx.recent_blockhash = Hash.default()
+        self.assertIs(tx.build_message(), tx.build_message())
+        
+        blockhash = str(Hash.default())
+        raw_tx, metadata = tx.prepare_for_broadcast(blockhash)
+        self.assertEqual(tx.prepare_for_broadcast(blockhash), (raw_tx, metadata))
+        
+        # A new instruction invalidates both caches
+        message = tx.build_message()
+        tx.create_transfer(self.recipient, self.amount)
+        self.assertIsNot(tx.build_message(), message)
+        self.assertEqual(len(tx.build_message().instructions), 2)
+        new_raw_tx, _ = tx.prepare_for_broadcast(blockhash)
+        self.assertNotEqual(new_raw_tx, raw_tx)
+    
+    def test_instructions_read_only(self):
+        """Test instructions can't be mutated behind the message cache"""
+        tx = QuantumTransaction(self.wallet)
+        tx.create_transfer(self.recipient, self.amount)
+        tx.recent_blockhash = Hash.default()
+        tx.build_message()
+        
+        self.assertIsInstance(tx.instructions, tuple)
+        with self.assertRaises(AttributeError):
+            tx.instructions.append(tx.instructions[0])
+        with self.assertRaises(AttributeError):
+            tx.instructions = []
+        
+        tx.add_instruction(tx.instructions[0])
+        self.assertEqual(len(tx.build_message().instructions), 2)
+    
     def test_verify_quantum_signature(self):
         """Test independent quantum signature verification"""
         tx = QuantumTransaction(self.wallet)
@@ -148,7 +207,67 @@ class TestTransactions(unittest.TestCase):
         
         is_valid_tampered = QuantumTransaction.verify_quantum_signature(tampered_tx, metadata, self.wallet)
         self.assertFalse(is_valid_tampered)
-    
+
+    def test_verify_hash_mismatch_skips_signature_check(self):
+        """Test a message that doesn't match transaction_hash is rejected before Dilithium"""
+        tx = QuantumTransaction(self.wallet)
+        tx.create_transfer(self.recipient, self.amount)
+        raw_tx, metadata = tx.prepare_for_broadcast(str(Hash.default()))
+        
+        other = QuantumTransaction(self.wallet)
+        other.create_transfer(self.recipient, self.amount * 2)
+        other_raw_tx, _ = other.prepare_for_broadcast(str(Hash.default()))
+        
+        with mock.patch.object(self.wallet.key_manager, "verify_signature",
+                               wraps=self.wallet.key_manager.verify_signature) as verify:
+            self.assertFalse(QuantumTransaction.verify_quantum_signature(other_raw_tx, metadata, self.wallet))
+            verify.assert_not_called()
+            self.assertTrue(QuantumTransaction.verify_quantum_signature(raw_tx, metadata, self.wallet))
+            verify.assert_called_once()
+
+    def test_verify_quantum_signatures_batch(self):
+        """Test batch quantum signature verification"""
+        blockhash = str(Hash.default())
+        raw_txs, metadatas = [], []
+        for amount in (self.amount, self.amount * 2):
+            tx = QuantumTransaction(self.wallet)
+            tx.create_transfer(self.recipient, amount)
+            raw_tx, metadata = tx.prepare_for_broadcast(blockhash)
+            raw_txs.append(raw_tx)
+            metadatas.append(metadata)
+
+        # Pair the first transaction with the second one's signature
+        raw_txs.append(raw_txs[0])
+        metadatas.append(metadatas[1])
+
+        results = QuantumTransaction.verify_quantum_signatures_batch(raw_txs, metadatas, self.wallet)
+        self.assertEqual(results, [True, True, False])
+
+        with self.assertRaises(ValueError):
+            QuantumTransaction.verify_quantum_signatures_batch(raw_txs, metadatas[:1], self.wallet)
+
+    @unittest.skipUnless(_dirac_mix.HAVE_NUMBA, "numba not installed")
+    def test_jit_improved_hash_matches_dirachash(self):
+        """Test the numba DiracHash kernel produces identical digests"""
+        for data in (b"", b"abc", bytes(range(256)) * 5):
+            for digest_size in (16, 32, 64):
+                self.assertEqual(
+                    _dirac_mix.improved_hash(data, digest_size),
+                    DiracHash.improved_hash(data, digest_size)
+                )
+
+    def test_numba_loaded_on_first_hash(self):
+        """Test importing the core modules doesn't import numba"""
+        code = (
+            "import sys; import dirac_wallet.core.transactions, dirac_wallet.core.address; "
+            "print('numba' in sys.modules)"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], cwd=str(project_root),
+            capture_output=True, text=True, check=True
+        ).stdout
+        self.assertEqual(output.strip().splitlines()[-1], "False")
+
     def test_missing_instructions(self):
         """Test error handling for missing instructions"""
         tx = QuantumTransaction(self.wallet)
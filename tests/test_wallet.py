@@ -1,11 +1,13 @@
 """
 Test wallet operations
 """
+import asyncio
+import json
 import unittest
 import tempfile
 import shutil
 from pathlib import Path
-from dirac_wallet.core.wallet import DiracWallet
+from dirac_wallet.core.wallet import DiracWallet, WALLET_FORMAT_MAGIC
 
 
 class TestWallet(unittest.TestCase):
@@ -65,6 +67,52 @@ class TestWallet(unittest.TestCase):
         # Verify wallet remains locked
         self.assertFalse(wallet.is_unlocked)
     
+    def test_unlock_async(self):
+        """Test unlocking and saving from inside an event loop"""
+        wallet = DiracWallet(str(self.wallet_path))
+        create_result = wallet.create(self.test_password)
+        wallet.lock()
+        
+        async def run():
+            self.assertTrue(await wallet.unlock_async(self.test_password))
+            await wallet.save_async(self.test_password)
+            wallet.lock()
+            with self.assertRaises(ValueError):
+                await wallet.unlock_async("wrong_password")
+            
+            # A missing file fails like unlock() does, without raising
+            missing = DiracWallet(str(Path(self.test_dir) / "missing.dwf"))
+            self.assertFalse(await missing.unlock_async(self.test_password))
+        
+        asyncio.run(run())
+        self.assertFalse(wallet.is_unlocked)
+        self.assertTrue(wallet.unlock(self.test_password))
+        self.assertEqual(wallet.solana_address, create_result["address"])
+    
+    def test_wallet_file_format(self):
+        """Test wallets are stored as CBOR and legacy JSON files still unlock"""
+        wallet = DiracWallet(str(self.wallet_path))
+        create_result = wallet.create(self.test_password)
+        
+        encrypted = self.wallet_path.read_bytes()
+        decrypted = wallet.storage.decrypt(encrypted, self.test_password)
+        self.assertTrue(decrypted.startswith(WALLET_FORMAT_MAGIC))
+        
+        # Rewrite the file in the legacy JSON layout
+        legacy = {
+            "keypair": wallet.keypair.serialize(),
+            "info": wallet.wallet_info.to_dict(),
+            "transaction_history": []
+        }
+        self.wallet_path.write_bytes(
+            wallet.storage.encrypt(json.dumps(legacy).encode('utf-8'), self.test_password)
+        )
+        self.assertLess(len(encrypted), len(self.wallet_path.read_bytes()))
+        
+        wallet.lock()
+        self.assertTrue(wallet.unlock(self.test_password))
+        self.assertEqual(wallet.solana_address, create_result["address"])
+    
     def test_wallet_info(self):
         """Test getting wallet information"""
         wallet = DiracWallet(str(self.wallet_path))
@@ -125,6 +173,22 @@ class TestWallet(unittest.TestCase):
         
         # Verify they have different addresses
         self.assertNotEqual(devnet_result["address"], testnet_result["address"])
+    
+    def test_memory_wallet(self):
+        """Test mem:// wallets round-trip without touching the filesystem"""
+        uri = "mem://test_memory_wallet.dwf"
+        wallet = DiracWallet(uri)
+        create_result = wallet.create(self.test_password)
+        self.assertEqual(create_result["path"], uri)
+        self.assertFalse(Path("mem:").exists())
+        
+        # A second instance on the same URI sees the stored file
+        reopened = DiracWallet(uri)
+        self.assertTrue(reopened.unlock(self.test_password))
+        self.assertEqual(reopened.solana_address, create_result["address"])
+        
+        reopened.wallet_path.unlink()
+        self.assertFalse(DiracWallet(uri).unlock(self.test_password))
 
 
 if __name__ == "__main__":